@@ -0,0 +1,69 @@
+"""
+Optional Numba-accelerated analysis kernel
+
+When numba and numpy are installed, the per-character passes of string
+analysis (frequency, word count, palindrome) run as a single compiled
+machine-code loop over the raw bytes. When they are not installed,
+`analyze_ascii` is None and core.utils keeps its pure-Python path.
+"""
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _analyze_bytes(data):
+        freq = np.zeros(256, np.int64)
+        n = data.shape[0]
+        words = 0
+        in_word = False
+        for k in range(n):
+            c = data[k]
+            freq[c] += 1
+            # ASCII whitespace, matching str.split(): space, \t-\r and
+            # the separator control characters \x1c-\x1f
+            if c == 32 or (9 <= c <= 13) or (28 <= c <= 31):
+                in_word = False
+            elif not in_word:
+                words += 1
+                in_word = True
+        # Case-insensitive two-pointer palindrome check
+        palindrome = True
+        i = 0
+        j = n - 1
+        while i < j:
+            a = data[i]
+            b = data[j]
+            if 65 <= a <= 90:
+                a += 32
+            if 65 <= b <= 90:
+                b += 32
+            if a != b:
+                palindrome = False
+                break
+            i += 1
+            j -= 1
+        return freq, words, palindrome
+
+    def analyze_ascii(value):
+        """
+        Analyze an ASCII string in one compiled pass
+
+        Args:
+            value (str): ASCII-only string to analyze
+
+        Returns:
+            tuple: (character frequency dict, word count, is_palindrome)
+        """
+        data = np.frombuffer(value.encode('ascii'), dtype=np.uint8)
+        freq, words, palindrome = _analyze_bytes(data)
+        frequency_map = {chr(i): int(freq[i]) for i in range(256) if freq[i]}
+        return frequency_map, words, bool(palindrome)
+
+else:
+    analyze_ascii = None
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-09-01 18:20
+
+from django.db import migrations, models
+
+
+def populate_char_bitmap(apps, schema_editor):
+    """Backfill char_bitmap for rows created before the column existed"""
+    from core.utils import calculate_char_bitmap
+
+    AnalyzedString = apps.get_model('core', 'AnalyzedString')
+    for analyzed_string in AnalyzedString.objects.all().iterator():
+        analyzed_string.char_bitmap = calculate_char_bitmap(analyzed_string.value)
+        analyzed_string.save(update_fields=['char_bitmap'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_analyzedstring_delete_stringentry_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analyzedstring',
+            name='char_bitmap',
+            field=models.BigIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(populate_char_bitmap, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-09-01 18:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_analyzedstring_char_bitmap'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='analyzedstring',
+            index=models.Index(fields=['-created_at', '-id'], name='analyzed_st_created_0be693_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-09-01 18:29
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_analyzedstring_analyzed_st_created_0be693_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='analyzedstring',
+            name='analyzed_st_sha256__c2c118_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='analyzedstring',
+            name='analyzed_st_is_pali_4e89db_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='analyzedstring',
+            name='analyzed_st_word_co_bf6cd4_idx',
+        ),
+    ]
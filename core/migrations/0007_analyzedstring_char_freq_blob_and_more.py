@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-09-01 18:31
+
+from django.db import migrations, models
+
+
+def pack_ascii_frequency_maps(apps, schema_editor):
+    """Move ASCII rows' JSON frequency maps into the packed blob column"""
+    from core.utils import encode_char_frequency
+
+    AnalyzedString = apps.get_model('core', 'AnalyzedString')
+    for analyzed_string in AnalyzedString.objects.all().iterator():
+        frequency_map = analyzed_string.character_frequency_map
+        if frequency_map is None or not analyzed_string.value.isascii():
+            continue
+        analyzed_string.char_freq_blob = encode_char_frequency(frequency_map)
+        analyzed_string.character_frequency_map = None
+        analyzed_string.save(update_fields=['char_freq_blob', 'character_frequency_map'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_remove_analyzedstring_analyzed_st_sha256__c2c118_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analyzedstring',
+            name='char_freq_blob',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='analyzedstring',
+            name='character_frequency_map',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.RunPython(pack_ascii_frequency_maps, migrations.RunPython.noop),
+    ]
@@ -15,7 +15,16 @@ class AnalyzedString(models.Model):
     is_palindrome = models.BooleanField(db_index=True)
     unique_characters = models.IntegerField()
     word_count = models.IntegerField(db_index=True)
-    character_frequency_map = models.JSONField()
+
+    # ASCII strings store their frequencies packed as 256 little-endian
+    # uint32 counters in char_freq_blob; only non-ASCII strings fall back
+    # to the JSON column
+    character_frequency_map = models.JSONField(null=True, blank=True)
+    char_freq_blob = models.BinaryField(null=True, blank=True)
+
+    # Bitmap of lowercase letters a-z present in the value; lets the
+    # contains_character filter test an indexed integer instead of LIKE
+    char_bitmap = models.BigIntegerField(default=0, db_index=True)
     
     # Timestamp
     created_at = models.DateTimeField(auto_now_add=True)
@@ -23,11 +32,13 @@ class AnalyzedString(models.Model):
     class Meta:
         db_table = 'analyzed_strings'
         ordering = ['-created_at']
+        # sha256_hash, is_palindrome and word_count already get an index
+        # from db_index=True/unique on the column, so only indexes with no
+        # column-level equivalent are declared here
         indexes = [
-            models.Index(fields=['sha256_hash']),
-            models.Index(fields=['is_palindrome']),
-            models.Index(fields=['word_count']),
             models.Index(fields=['length']),
+            # Composite index backing keyset pagination on (created_at, id)
+            models.Index(fields=['-created_at', '-id']),
         ]
     
     def __str__(self):
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import AnalyzedString
+from .utils import decode_char_frequency
 
 
 class AnalyzedStringSerializer(serializers.ModelSerializer):
@@ -13,14 +14,35 @@ class AnalyzedStringSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at']
     
     def get_properties(self, obj):
-        
+
+        if obj.char_freq_blob:
+            frequency_map = decode_char_frequency(obj.char_freq_blob)
+        else:
+            frequency_map = obj.character_frequency_map
         return {
             'length': obj.length,
             'is_palindrome': obj.is_palindrome,
             'unique_characters': obj.unique_characters,
             'word_count': obj.word_count,
             'sha256_hash': obj.sha256_hash,
-            'character_frequency_map': obj.character_frequency_map
+            'character_frequency_map': frequency_map
+        }
+
+
+class AnalyzedStringListSerializer(AnalyzedStringSerializer):
+    """
+    List-endpoint variant that omits character_frequency_map so the
+    heavyweight JSON column is neither fetched nor re-encoded per row
+    """
+
+    def get_properties(self, obj):
+
+        return {
+            'length': obj.length,
+            'is_palindrome': obj.is_palindrome,
+            'unique_characters': obj.unique_characters,
+            'word_count': obj.word_count,
+            'sha256_hash': obj.sha256_hash
         }
 
 
@@ -1,11 +1,24 @@
 from django.urls import path
-from .views import StringCreateListView, StringDetailView, NaturalLanguageFilterView
+from .views import (
+    StringBulkCreateView,
+    StringCreateListView,
+    StringDetailByHashView,
+    StringDetailView,
+    NaturalLanguageFilterView,
+)
 
 urlpatterns = [
     # Natural language filter MUST come before the detail view
     # to avoid matching "filter-by-natural-language" as a string_value
     path('strings/filter-by-natural-language', NaturalLanguageFilterView.as_view(), name='natural_language_filter'),
-    
+
+    # Bulk create (also before the detail view so "bulk" is not a string_value)
+    path('strings/bulk', StringBulkCreateView.as_view(), name='string_bulk_create'),
+
+    # Canonical hash-based lookup: the hash is unique, indexed and always
+    # URL-safe, unlike raw string values
+    path('strings/by-hash/<str:sha256_hash>', StringDetailByHashView.as_view(), name='string_detail_by_hash'),
+
     # Create and list strings
     path('strings', StringCreateListView.as_view(), name='string_create_list'),
     
@@ -1,64 +1,236 @@
+import functools
 import hashlib
+import logging
 import re
+import ssl
+import sys
+from array import array
 from collections import Counter
 
+from ._fast import analyze_ascii
+
+logger = logging.getLogger(__name__)
+
+# Bind the constructor once at import so the hot path is a single call into
+# OpenSSL's native SHA-256 (hardware-accelerated via SHA-NI where available).
+_sha256 = hashlib.sha256
+
+# OpenSSL < 1.1.1 lacks the SHA-NI assembly path, so hashing falls back to
+# the generic implementation. Warn once at startup rather than per request.
+if ssl.OPENSSL_VERSION_INFO[:3] < (1, 1, 1):
+    logger.warning(
+        "OpenSSL %s predates 1.1.1; SHA-256 will not use hardware acceleration",
+        ssl.OPENSSL_VERSION
+    )
+
 
 def calculate_sha256(value):
-   
-    return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+    return _sha256(value.encode('utf-8')).hexdigest()
+
+
+def calculate_sha256_batch(values):
+    """
+    Compute SHA-256 hex digests for a list of strings in one pass
+
+    Args:
+        values (list): List of strings to hash
+
+    Returns:
+        list: Hex digest for each input, in the same order
+    """
+    sha256 = _sha256
+    return [sha256(value.encode('utf-8')).hexdigest() for value in values]
+
+
+# Translation table mapping ASCII A-Z onto a-z for the bytes fast path
+_ASCII_LOWER = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+# Block size for the chunked palindrome compare
+_PALINDROME_CHUNK = 64
+
+
+def _bytes_palindrome(data):
+    """
+    Two-pointer palindrome check over bytes, comparing in 64-byte blocks
+
+    Each block step compares a head slice against the reversed tail slice
+    with one C-level memcmp instead of 64 interpreted comparisons; the
+    leftover middle falls back to byte-at-a-time. Either loop bails out
+    at the first mismatching block or byte.
+    """
+    i, j = 0, len(data)
+    while j - i >= 2 * _PALINDROME_CHUNK:
+        if data[i:i + _PALINDROME_CHUNK] != data[j - _PALINDROME_CHUNK:j][::-1]:
+            return False
+        i += _PALINDROME_CHUNK
+        j -= _PALINDROME_CHUNK
+    while i < j - 1:
+        if data[i] != data[j - 1]:
+            return False
+        i += 1
+        j -= 1
+    return True
 
 
 def check_palindrome(value):
-   
+
+    # ASCII fast path: a single bytes.translate replaces str.lower()'s
+    # per-codepoint case mapping, and the compare walks the raw bytes
+    if value.isascii():
+        return _bytes_palindrome(value.encode('ascii').translate(_ASCII_LOWER))
+
     # Convert to lowercase for case-insensitive comparison
     cleaned = value.lower()
-    return cleaned == cleaned[::-1]
+    # Two-pointer compare: no reversed copy is allocated and non-palindromes
+    # bail out at the first mismatched pair instead of walking the whole string
+    i, j = 0, len(cleaned) - 1
+    while i < j:
+        if cleaned[i] != cleaned[j]:
+            return False
+        i += 1
+        j -= 1
+    return True
 
 
-def count_unique_characters(value):
-    
-    return len(set(value))
+def calculate_char_bitmap(value):
+    """
+    Build a bitmap of the lowercase letters a-z present in a string
 
+    Bit i is set when chr(97 + i) appears in the lowercased string. The
+    contains-character filter can then test an indexed integer column
+    instead of running a LIKE scan over the full text.
 
-def count_words(value):
-    
-    return len(value.split())
+    Args:
+        value (str): The string to analyze
+
+    Returns:
+        int: Bitmap with one bit per letter a-z
+    """
+    bitmap = 0
+    for char in set(value.lower()):
+        if 'a' <= char <= 'z':
+            bitmap |= 1 << (ord(char) - 97)
+    return bitmap
 
 
-def calculate_character_frequency(value):
+def encode_char_frequency(frequency_map):
     """
-    Calculate the frequency of each character in a string
-    
+    Pack an ASCII character frequency map into a fixed 1 KiB blob
+
+    The blob holds 256 little-endian uint32 counters indexed by byte
+    value, so storing it avoids the per-row JSON encode/decode that a
+    JSONField costs on every read and write.
+
     Args:
-        value (str): The string to analyze
-    
+        frequency_map (dict): Mapping of single ASCII characters to counts
+
     Returns:
-        dict: Dictionary mapping each character to its occurrence count
+        bytes: 1024-byte packed counter array
     """
-    return dict(Counter(value))
+    counters = [0] * 256
+    for char, count in frequency_map.items():
+        counters[ord(char)] = count
+    packed = array('I', counters)
+    if sys.byteorder != 'little':
+        packed.byteswap()
+    return packed.tobytes()
 
 
+def decode_char_frequency(blob):
+    """
+    Unpack a blob built by encode_char_frequency back into a dict
+
+    Args:
+        blob (bytes): 1024-byte packed counter array
+
+    Returns:
+        dict: Mapping of each character with a nonzero count to its count
+    """
+    packed = array('I')
+    packed.frombytes(bytes(blob))
+    if sys.byteorder != 'little':
+        packed.byteswap()
+    return {chr(i): count for i, count in enumerate(packed) if count}
+
+
+@functools.lru_cache(maxsize=10000)
 def analyze_string(value):
     """
     Analyze a string and compute all properties
-    
+
+    Results are memoized per process, so repeated submissions of the same
+    string (duplicate-heavy traffic) skip the hashing and analysis work
+    entirely. Callers must treat the returned dict as read-only.
+
     Args:
         value (str): The string to analyze
-    
+
     Returns:
         dict: Dictionary containing all computed properties
     """
+    # Fast path: when the optional Numba kernel is installed, ASCII strings
+    # get frequency, word count and palindrome from one compiled pass
+    if analyze_ascii is not None and value.isascii():
+        frequency_map, word_count, is_palindrome = analyze_ascii(value)
+        return {
+            'value': value,
+            'sha256_hash': calculate_sha256(value),
+            'length': len(value),
+            'is_palindrome': is_palindrome,
+            'unique_characters': len(frequency_map),
+            'word_count': word_count,
+            # ASCII frequencies are stored packed; the JSON column stays
+            # null and the serializer rebuilds the map from the blob
+            'character_frequency_map': None,
+            'char_freq_blob': encode_char_frequency(frequency_map),
+            'char_bitmap': calculate_char_bitmap(value)
+        }
+
+    # One Counter pass yields both the frequency map and the unique-character
+    # count, so the string is walked once for those instead of twice.
+    counts = Counter(value)
+    is_ascii = value.isascii()
     return {
         'value': value,
         'sha256_hash': calculate_sha256(value),
         'length': len(value),
         'is_palindrome': check_palindrome(value),
-        'unique_characters': count_unique_characters(value),
-        'word_count': count_words(value),
-        'character_frequency_map': calculate_character_frequency(value)
+        'unique_characters': len(counts),
+        'word_count': len(value.split()),
+        'character_frequency_map': None if is_ascii else dict(counts),
+        'char_freq_blob': encode_char_frequency(counts) if is_ascii else None,
+        'char_bitmap': calculate_char_bitmap(value)
     }
 
 
+# All fixed keyword phrases folded into one alternation so a single linear
+# scan of the query replaces a separate `in` scan per keyword. Longer
+# variants come first so they win over their prefixes.
+_KEYWORD_RE = re.compile(
+    r'palindromic|palindrome|reads the same'
+    r'|single word|one word|two word|three word'
+    r'|first vowel'
+)
+
+# All capturing patterns fused into one alternation with named groups, so
+# one finditer pass over the query replaces a separate search per pattern.
+# The word-count branch precedes the letter branches so "with 5 words" is
+# consumed as a count rather than as a contains match, and the letter
+# captures are zero-width lookaheads so e.g. "with at least 5" still lets
+# the scan find "at least 5" after matching "with a".
+_FILTER_RE = re.compile(
+    r'longer than (?P<longer>\d+)'
+    r'|shorter than (?P<shorter>\d+)'
+    r'|at least (?P<at_least>\d+) characters?'
+    r'|at most (?P<at_most>\d+) characters?'
+    r'|with (?P<word_count>\d+) words?'
+    r'|contain(?:ing|s)?(?: the letter)? (?=(?P<contains>[a-z]))'
+    r'|with(?: the letter)? (?=(?P<with_char>[a-z]))'
+    r'|that have(?: the letter)? (?=(?P<have_char>[a-z]))'
+)
+
+
 def parse_natural_language_query(query):
     """
     Parse natural language query and convert to filters
@@ -79,62 +251,57 @@ def parse_natural_language_query(query):
     if not query_lower:
         raise ValueError("Query cannot be empty")
     
+    # Collect every fixed keyword phrase in one pass over the query
+    keywords = set(_KEYWORD_RE.findall(query_lower))
+
     # Check for palindrome keywords
-    palindrome_keywords = ['palindrome', 'palindromic', 'reads the same']
-    if any(keyword in query_lower for keyword in palindrome_keywords):
+    if keywords & {'palindrome', 'palindromic', 'reads the same'}:
         filters['is_palindrome'] = True
-    
+
     # Check for word count
     # "single word" or "one word"
-    if 'single word' in query_lower or 'one word' in query_lower:
+    if 'single word' in keywords or 'one word' in keywords:
         filters['word_count'] = 1
-    elif 'two word' in query_lower:
+    elif 'two word' in keywords:
         filters['word_count'] = 2
-    elif 'three word' in query_lower:
+    elif 'three word' in keywords:
         filters['word_count'] = 3
-    
+
+    # Collect the first hit for each capturing pattern in one scan
+    hits = {}
+    for match in _FILTER_RE.finditer(query_lower):
+        group = match.lastgroup
+        if group not in hits:
+            hits[group] = match.group(group)
+
     # Extract specific word count: "strings with 5 words"
-    word_count_match = re.search(r'with (\d+) words?', query_lower)
-    if word_count_match:
-        filters['word_count'] = int(word_count_match.group(1))
-    
+    if 'word_count' in hits:
+        filters['word_count'] = int(hits['word_count'])
+
     # Check for length constraints
-    # "longer than X characters"
-    longer_match = re.search(r'longer than (\d+)', query_lower)
-    if longer_match:
-        filters['min_length'] = int(longer_match.group(1)) + 1
-    
-    # "shorter than X characters"
-    shorter_match = re.search(r'shorter than (\d+)', query_lower)
-    if shorter_match:
-        filters['max_length'] = int(shorter_match.group(1)) - 1
-    
-    # "at least X characters"
-    at_least_match = re.search(r'at least (\d+) characters?', query_lower)
-    if at_least_match:
-        filters['min_length'] = int(at_least_match.group(1))
-    
-    # "at most X characters"
-    at_most_match = re.search(r'at most (\d+) characters?', query_lower)
-    if at_most_match:
-        filters['max_length'] = int(at_most_match.group(1))
-    
+    # "longer than X" / "shorter than X" are exclusive bounds,
+    # "at least X" / "at most X" are inclusive and take precedence
+    if 'longer' in hits:
+        filters['min_length'] = int(hits['longer']) + 1
+
+    if 'shorter' in hits:
+        filters['max_length'] = int(hits['shorter']) - 1
+
+    if 'at_least' in hits:
+        filters['min_length'] = int(hits['at_least'])
+
+    if 'at_most' in hits:
+        filters['max_length'] = int(hits['at_most'])
+
     # Check for character contains
     # "containing the letter X" or "contains X" or "with the letter X"
-    contains_patterns = [
-        r'contain(?:ing|s)?(?: the letter)? ([a-z])',
-        r'with(?: the letter)? ([a-z])',
-        r'that have(?: the letter)? ([a-z])'
-    ]
-    
-    for pattern in contains_patterns:
-        contains_match = re.search(pattern, query_lower)
-        if contains_match:
-            filters['contains_character'] = contains_match.group(1)
+    for group in ('contains', 'with_char', 'have_char'):
+        if group in hits:
+            filters['contains_character'] = hits[group]
             break
-    
+
     # Special case: "first vowel" = 'a'
-    if 'first vowel' in query_lower:
+    if 'first vowel' in keywords:
         filters['contains_character'] = 'a'
     
     # Check for conflicts
@@ -1,10 +1,109 @@
+from datetime import datetime
+
+import orjson
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Q
+from django.db import IntegrityError
+from django.db.models import F, Q
+from django.http import StreamingHttpResponse
 from .models import AnalyzedString
-from .serializers import AnalyzedStringSerializer, StringInputSerializer
-from .utils import analyze_string, parse_natural_language_query
+from .serializers import (
+    AnalyzedStringListSerializer,
+    AnalyzedStringSerializer,
+    StringInputSerializer,
+)
+from .utils import (
+    analyze_string,
+    calculate_sha256,
+    calculate_sha256_batch,
+    parse_natural_language_query,
+)
+
+
+# Keyset pagination defaults for the list endpoints
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def _make_cursor(row):
+    """Build the opaque keyset cursor for a row: "<created_at>_<pk>" """
+    timestamp = row.created_at.isoformat().replace('+00:00', 'Z')
+    return f'{timestamp}_{row.pk}'
+
+
+def _apply_keyset_pagination(queryset, request):
+    """
+    Apply keyset pagination from the "after" and "limit" query parameters
+
+    The cursor encodes (created_at, pk) of the last row seen, so each page
+    is an O(limit) index walk instead of a scan over all earlier rows.
+
+    Returns:
+        tuple: (paginated queryset, limit)
+
+    Raises:
+        ValueError: If "after" or "limit" is malformed
+    """
+    limit = request.GET.get('limit')
+    if limit is None:
+        limit_int = DEFAULT_PAGE_SIZE
+    else:
+        limit_int = int(limit)
+        if limit_int < 1 or limit_int > MAX_PAGE_SIZE:
+            raise ValueError(f'limit must be between 1 and {MAX_PAGE_SIZE}')
+
+    after = request.GET.get('after')
+    if after:
+        timestamp_str, _, pk_str = after.rpartition('_')
+        after_ts = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        after_pk = int(pk_str)
+        queryset = queryset.filter(
+            Q(created_at__lt=after_ts)
+            | Q(created_at=after_ts, id__lt=after_pk)
+        )
+
+    return queryset.order_by('-created_at', '-id')[:limit_int], limit_int
+
+
+def _stream_list_response(rows, serializer, trailer_fields, limit):
+    """
+    Yield a JSON object with a "data" array of serialized rows, followed by
+    "count" and the given trailer fields
+
+    Rows are encoded one at a time so memory stays constant regardless of
+    how many rows the query matches.
+    """
+    yield b'{"data":['
+    count = 0
+    last_row = None
+    for row in rows:
+        yield (b',' if count else b'') + orjson.dumps(serializer.to_representation(row))
+        count += 1
+        last_row = row
+    # A full page means there may be more rows after the last one
+    next_cursor = _make_cursor(last_row) if count == limit else None
+    trailer = {'count': count, 'next_cursor': next_cursor}
+    trailer.update(trailer_fields)
+    yield b'],' + orjson.dumps(trailer)[1:]
+
+
+def _filter_contains_character(queryset, character):
+    """
+    Filter a queryset to rows whose value contains the given character
+
+    For letters a-z the indexed char_bitmap column is tested instead of
+    running an unindexed LIKE scan over the full text. Other characters
+    fall back to icontains.
+    """
+    lowered = character.lower()
+    if 'a' <= lowered <= 'z':
+        mask = 1 << (ord(lowered) - 97)
+        return queryset.annotate(
+            _char_match=F('char_bitmap').bitand(mask)
+        ).filter(_char_match__gt=0)
+    return queryset.filter(value__icontains=character)
 
 
 class StringCreateListView(APIView):
@@ -52,24 +151,26 @@ class StringCreateListView(APIView):
         # Analyze the string
         properties = analyze_string(value)
         
-        # Check if string already exists (by sha256_hash)
-        if AnalyzedString.objects.filter(sha256_hash=properties['sha256_hash']).exists():
+        # Insert directly and let the unique constraint reject duplicates:
+        # one atomic round-trip instead of a racy exists() + create() pair
+        try:
+            analyzed_string = AnalyzedString.objects.create(
+                value=properties['value'],
+                sha256_hash=properties['sha256_hash'],
+                length=properties['length'],
+                is_palindrome=properties['is_palindrome'],
+                unique_characters=properties['unique_characters'],
+                word_count=properties['word_count'],
+                character_frequency_map=properties['character_frequency_map'],
+                char_freq_blob=properties['char_freq_blob'],
+                char_bitmap=properties['char_bitmap']
+            )
+        except IntegrityError:
             return Response(
                 {'error': 'String already exists in the system'},
                 status=status.HTTP_409_CONFLICT
             )
         
-        # Create new AnalyzedString object
-        analyzed_string = AnalyzedString.objects.create(
-            value=properties['value'],
-            sha256_hash=properties['sha256_hash'],
-            length=properties['length'],
-            is_palindrome=properties['is_palindrome'],
-            unique_characters=properties['unique_characters'],
-            word_count=properties['word_count'],
-            character_frequency_map=properties['character_frequency_map']
-        )
-        
         # Serialize and return
         serializer = AnalyzedStringSerializer(analyzed_string)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -84,13 +185,18 @@ class StringCreateListView(APIView):
             max_length: integer (maximum string length)
             word_count: integer (exact word count)
             contains_character: string (single character to search for)
-        
+            include: set to "character_frequency_map" to include the
+                per-character frequency map for each row
+            limit: page size (default 100, max 1000)
+            after: keyset cursor from a previous response's next_cursor
+
         Returns:
             200: List of strings with filters applied
             400: Invalid query parameter values or types
         """
         queryset = AnalyzedString.objects.all()
         filters_applied = {}
+        include_frequency_map = request.GET.get('include') == 'character_frequency_map'
         
         # Apply filters from query parameters
         try:
@@ -159,7 +265,7 @@ class StringCreateListView(APIView):
                         {'error': 'contains_character must be a single character'},
                         status=status.HTTP_400_BAD_REQUEST
                     )
-                queryset = queryset.filter(value__icontains=contains_character)
+                queryset = _filter_contains_character(queryset, contains_character)
                 filters_applied['contains_character'] = contains_character
         
         except Exception as e:
@@ -168,14 +274,119 @@ class StringCreateListView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Serialize results
-        serializer = AnalyzedStringSerializer(queryset, many=True)
-        
+        # Unless explicitly requested, skip fetching and decoding the JSON
+        # frequency map for every row
+        if include_frequency_map:
+            serializer_class = AnalyzedStringSerializer
+        else:
+            serializer_class = AnalyzedStringListSerializer
+            queryset = queryset.only(
+                'sha256_hash', 'value', 'length', 'is_palindrome',
+                'unique_characters', 'word_count', 'created_at'
+            )
+
+        # Keyset pagination keeps each page O(limit) however large the table
+        try:
+            queryset, limit = _apply_keyset_pagination(queryset, request)
+        except ValueError:
+            return Response(
+                {'error': 'Invalid pagination parameters. "limit" must be an '
+                          f'integer between 1 and {MAX_PAGE_SIZE} and "after" '
+                          'a cursor from a previous response.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Stream rows straight from the DB cursor instead of materializing
+        # the whole result set and its serialized copy in memory
+        return StreamingHttpResponse(
+            _stream_list_response(
+                queryset.iterator(chunk_size=1000),
+                serializer_class(),
+                {'filters_applied': filters_applied},
+                limit
+            ),
+            content_type='application/json',
+            status=status.HTTP_200_OK
+        )
+
+
+class StringBulkCreateView(APIView):
+    """
+    POST /strings/bulk - Create and analyze a batch of strings
+    """
+
+    def post(self, request):
+        """
+        Create and analyze a batch of strings with a fixed number of queries
+
+        Request body: {"values": ["...", "...", ...]}
+
+        Returns:
+            201: Batch processed; response lists the newly created strings
+            400: Missing "values" field or empty list
+            422: "values" is not a list of strings
+        """
+        if 'values' not in request.data:
+            return Response(
+                {'error': 'Missing "values" field in request body'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        values = request.data['values']
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            return Response(
+                {'error': 'Invalid data type for "values". Must be a list of strings.'},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY
+            )
+
+        if not values:
+            return Response(
+                {'error': '"values" must not be empty'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Hash the whole batch up front and drop in-batch duplicates
+        hashes = calculate_sha256_batch(values)
+        unique_values = {}
+        for sha256_hash, value in zip(hashes, values):
+            unique_values.setdefault(sha256_hash, value)
+
+        # One query finds every hash the table already holds
+        existing = set(
+            AnalyzedString.objects.filter(
+                sha256_hash__in=unique_values
+            ).values_list('sha256_hash', flat=True)
+        )
+
+        new_strings = []
+        for sha256_hash, value in unique_values.items():
+            if sha256_hash in existing:
+                continue
+            properties = analyze_string(value)
+            new_strings.append(AnalyzedString(
+                value=properties['value'],
+                sha256_hash=properties['sha256_hash'],
+                length=properties['length'],
+                is_palindrome=properties['is_palindrome'],
+                unique_characters=properties['unique_characters'],
+                word_count=properties['word_count'],
+                character_frequency_map=properties['character_frequency_map'],
+                char_freq_blob=properties['char_freq_blob'],
+                char_bitmap=properties['char_bitmap']
+            ))
+
+        # Single INSERT; the unique constraint absorbs races with
+        # concurrent writers
+        AnalyzedString.objects.bulk_create(
+            new_strings, ignore_conflicts=True, batch_size=500
+        )
+
+        serializer = AnalyzedStringSerializer(new_strings, many=True)
         return Response({
             'data': serializer.data,
-            'count': queryset.count(),
-            'filters_applied': filters_applied
-        }, status=status.HTTP_200_OK)
+            'created': len(new_strings),
+            'duplicates': len(values) - len(new_strings)
+        }, status=status.HTTP_201_CREATED)
 
 
 class StringDetailView(APIView):
@@ -187,13 +398,17 @@ class StringDetailView(APIView):
     def get(self, request, string_value):
         """
         Get a specific string by its value
-        
+
         Returns:
             200: String found and returned
             404: String does not exist
         """
         try:
-            analyzed_string = AnalyzedString.objects.get(value=string_value)
+            # Hash the value and probe the indexed fixed-width hash column
+            # instead of comparing against the full text of every row
+            analyzed_string = AnalyzedString.objects.get(
+                sha256_hash=calculate_sha256(string_value)
+            )
             serializer = AnalyzedStringSerializer(analyzed_string)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except AnalyzedString.DoesNotExist:
@@ -201,17 +416,62 @@ class StringDetailView(APIView):
                 {'error': 'String does not exist in the system'},
                 status=status.HTTP_404_NOT_FOUND
             )
-    
+
     def delete(self, request, string_value):
         """
         Delete a specific string by its value
-        
+
+        Returns:
+            204: String deleted successfully (no content)
+            404: String does not exist
+        """
+        try:
+            analyzed_string = AnalyzedString.objects.get(
+                sha256_hash=calculate_sha256(string_value)
+            )
+            analyzed_string.delete()
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        except AnalyzedString.DoesNotExist:
+            return Response(
+                {'error': 'String does not exist in the system'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+
+class StringDetailByHashView(APIView):
+    """
+    GET /strings/by-hash/{sha256_hash} - Get a specific string by its hash
+    DELETE /strings/by-hash/{sha256_hash} - Delete a specific string by its hash
+    """
+
+    def get(self, request, sha256_hash):
+        """
+        Get a specific string by its SHA-256 hash
+
+        Returns:
+            200: String found and returned
+            404: String does not exist
+        """
+        try:
+            analyzed_string = AnalyzedString.objects.get(sha256_hash=sha256_hash)
+            serializer = AnalyzedStringSerializer(analyzed_string)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        except AnalyzedString.DoesNotExist:
+            return Response(
+                {'error': 'String does not exist in the system'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+    def delete(self, request, sha256_hash):
+        """
+        Delete a specific string by its SHA-256 hash
+
         Returns:
             204: String deleted successfully (no content)
             404: String does not exist
         """
         try:
-            analyzed_string = AnalyzedString.objects.get(value=string_value)
+            analyzed_string = AnalyzedString.objects.get(sha256_hash=sha256_hash)
             analyzed_string.delete()
             return Response(status=status.HTTP_204_NO_CONTENT)
         except AnalyzedString.DoesNotExist:
@@ -232,7 +492,9 @@ class NaturalLanguageFilterView(APIView):
         
         Query Parameters:
             query: Natural language query string
-        
+            limit: page size (default 100, max 1000)
+            after: keyset cursor from a previous response's next_cursor
+
         Returns:
             200: Filtered results with interpreted query
             400: Unable to parse query
@@ -280,7 +542,7 @@ class NaturalLanguageFilterView(APIView):
                 queryset = queryset.filter(length__lte=parsed_filters['max_length'])
             
             if 'contains_character' in parsed_filters:
-                queryset = queryset.filter(value__icontains=parsed_filters['contains_character'])
+                queryset = _filter_contains_character(queryset, parsed_filters['contains_character'])
         
         except Exception as e:
             return Response(
@@ -288,12 +550,26 @@ class NaturalLanguageFilterView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Serialize results
-        serializer = AnalyzedStringSerializer(queryset, many=True)
-        
+        # Keyset pagination keeps each page O(limit) however large the table
+        try:
+            queryset, limit = _apply_keyset_pagination(queryset, request)
+        except ValueError:
+            return Response(
+                {'error': 'Invalid pagination parameters. "limit" must be an '
+                          f'integer between 1 and {MAX_PAGE_SIZE} and "after" '
+                          'a cursor from a previous response.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Evaluate the queryset once so the count comes from the fetched rows
+        # instead of a second SELECT COUNT(*) round-trip
+        results = list(queryset)
+        serializer = AnalyzedStringSerializer(results, many=True)
+
         return Response({
             'data': serializer.data,
-            'count': queryset.count(),
+            'count': len(results),
+            'next_cursor': _make_cursor(results[-1]) if len(results) == limit else None,
             'interpreted_query': {
                 'original': query,
                 'parsed_filters': parsed_filters
@@ -177,6 +177,18 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 CORS_ALLOW_ALL_ORIGINS = True
 
 
+# REST framework: render JSON through orjson (Rust, SIMD-accelerated)
+# instead of the pure-Python stdlib encoder
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'drf_orjson_renderer.renderers.ORJSONRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'drf_orjson_renderer.parsers.ORJSONParser',
+    ],
+}
+
+
 
 # Logging configuration
 LOGGING = {